@@ -20,6 +20,8 @@ Technologies Used:
 - Python: The programming language used for scripting the ETL process.
 - Prefect: For orchestrating the ETL workflow.
 - Pandas: For data manipulation and cleaning.
+- DuckDB: For fast, multithreaded CSV parsing and type inference.
+- PyArrow: For handing parsed chunks from DuckDB to pandas and caching them as Parquet.
 - SQLAlchemy+MySQL Connector: For database connectivity and operations.
 - MySQL: The target database for storing the processed data.
 
@@ -39,10 +41,26 @@ Output:
 # -----------------------------------------------
 # Import necessary libraries
 # -----------------------------------------------
+import duckdb
+import numpy as np
 import pandas as pd
-from prefect import flow, task
-from sqlalchemy import create_engine
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from prefect import flow, get_run_logger, task
+from prefect.task_runners import ThreadPoolTaskRunner
+from sqlalchemy import Integer, Numeric, String, create_engine, event
+from sqlalchemy.engine import make_url
+import atexit
+import contextlib
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
 import os
+import re
+import tempfile
+from typing import Iterator
 from  dotenv import load_dotenv
 from urllib.parse import quote_plus
 
@@ -60,28 +78,330 @@ DB_NAME = os.getenv("MYSQL_DATABASE")
 DB_TABLE = os.getenv("MYSQL_TABLE")
 CSV_FILE_PATH = os.getenv("DATASET_PATH")
 
+# Rows extracted, transformed and loaded together; bounds peak memory
+EXTRACT_CHUNK_ROWS = 200_000
+# Chunks being transformed or loaded at the same time
+MAX_CHUNKS_IN_FLIGHT = 2
+
+# Characters dropped from column names after lowercasing
+INVALID_COLUMN_CHARS = re.compile(r"[^a-z0-9_]")
+
+# Values sampled (evenly spread over the column) per text column to rule it
+# out before a full numeric parse
+NUMERIC_SAMPLE_ROWS = 1_000
+NUMERIC_SAMPLE_CUTOFF = 0.5
+
+# Text accepted as a number (matched after lowercasing and dropping a leading "+"):
+# decimal or scientific notation and infinities, as pd.to_numeric accepts.
+# "nan" is left unmatched so it counts as missing, as it does for pd.to_numeric.
+NUMBER_PATTERN = r"^-?((\d+\.?\d*|\.\d+)(e[-+]?\d+)?|inf(inity)?)$"
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORY_COLUMNS = ["model", "region", "color", "fuel_type", "transmission", "sales_classification"]
+# Columns expected to hold text; they never need numeric detection on typed input
+KNOWN_STRING_COLUMNS = CATEGORY_COLUMNS
+
+# Columns expected to hold numbers; text in them is converted without detection
+KNOWN_NUMERIC_COLUMNS = ["year", "engine_size_l", "mileage_km", "price_usd", "sales_volume"]
+# Currency symbols, thousands separators and spaces stripped from known numeric columns
+NUMBER_FORMATTING_CHARS = r"[,$ ]"
+
+# Compact pandas types for the known integer columns.
+# Narrower values shrink the in-memory footprint of each chunk; the SQL column types come from SCHEMA.
+# engine_size_l stays float64: float32 would serialize 1.6 as 1.600000023841858.
+DOWNCAST_TYPES = {
+    "year": pa.int16(),
+    "mileage_km": pa.int32(),
+    "price_usd": pa.int32(),
+    "sales_volume": pa.int32(),
+}
+# MySQL column types for the target table (see schema.sql). Declaring them
+# up front spares to_sql the per-column type inference and keeps text
+# columns as bounded VARCHARs instead of TEXT.
+SCHEMA = {
+    "model": String(50),
+    "year": Integer(),
+    "region": String(50),
+    "color": String(30),
+    "fuel_type": String(20),
+    "transmission": String(20),
+    "engine_size_l": Numeric(3, 1),
+    "mileage_km": Integer(),
+    "price_usd": Numeric(10, 2),
+    "sales_volume": Integer(),
+    "sales_classification": String(20),
+}
+
+# MySQL caps a single prepared statement at 65,535 placeholders, so the
+# multi-row INSERT batch size is bounded by the number of columns.
+MAX_INSERT_PLACEHOLDERS = 65_000
+MAX_INSERT_CHUNKSIZE = 10_000
+
+# Opt-in bulk load through LOAD DATA LOCAL INFILE. Only enable it when the
+# server has local_infile=ON (off by default in MySQL 8); otherwise rows are
+# sent as batched INSERTs via to_sql.
+USE_LOAD_INFILE = os.getenv("MYSQL_LOAD_INFILE", "false").lower() in ("1", "true", "yes")
+
+# -----------------------------------------------
+# Helper Functions
+# -----------------------------------------------
+def create_db_engine(connection_route: str):
+    """
+    Creates a SQLAlchemy engine tuned for bulk inserts.
+    - Sends executemany() batches as multi-row INSERTs (insertmanyvalues).
+    - Enables the driver-specific executemany fast paths where available.
+    Args:
+        connection_route (str): SQLAlchemy database URL.
+    Returns:
+        Engine: Configured SQLAlchemy engine.
+    """
+    url = make_url(connection_route)
+    engine_options = {
+        "insertmanyvalues_page_size": MAX_INSERT_CHUNKSIZE,
+        "pool_size": 4,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+    if USE_LOAD_INFILE and url.get_backend_name() == "mysql":
+        # each MySQL driver spells the local-infile switch differently
+        if url.get_driver_name() == "mysqlconnector":
+            engine_options["connect_args"] = {"allow_local_infile": True}
+        elif url.get_driver_name() in ("pymysql", "mysqldb"):
+            engine_options["connect_args"] = {"local_infile": True}
+    if url.get_driver_name() == "psycopg2":
+        engine_options["executemany_mode"] = "values_plus_batch"
+    engine = create_engine(url, **engine_options)
+
+    if url.get_driver_name() == "pyodbc":
+        @event.listens_for(engine, "before_cursor_execute")
+        def _enable_fast_executemany(conn, cursor, statement, parameters, context, executemany):
+            if executemany:
+                cursor.fast_executemany = True
+
+    return engine
+
+@functools.lru_cache(maxsize=1)
+def get_engine():
+    """
+    Returns the process-wide SQLAlchemy engine for the MySQL database.
+    - Built once so repeated loads reuse the pooled connections.
+    - Disposed when the interpreter exits.
+    Returns:
+        Engine: Shared SQLAlchemy engine.
+    """
+    encoded_password = quote_plus(DB_PASSWORD)
+    connection_route = f"mysql+mysqlconnector://{DB_USER}:{encoded_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    engine = create_db_engine(connection_route)
+    atexit.register(engine.dispose)
+    return engine
+
+def load_data_infile(df: pd.DataFrame, engine, table: str, if_exists: str = "replace", dtype: dict = None):
+    """
+    Bulk loads a DataFrame with MySQL's LOAD DATA LOCAL INFILE.
+    - Creates (or replaces) the table from the DataFrame's column types.
+    - Streams the rows from a temporary CSV file straight into the server.
+    Args:
+        df (pd.DataFrame): Cleaned data DataFrame.
+        engine: SQLAlchemy engine for a MySQL driver with local infile enabled
+            (create_db_engine() does this when MYSQL_LOAD_INFILE is set).
+        table (str): Target table name.
+        if_exists (str): "replace" to recreate the table, "append" to add rows.
+        dtype (dict): Optional SQLAlchemy column types passed to to_sql.
+    """
+    # create an empty table matching the DataFrame dtypes
+    df.head(0).to_sql(name=table, con=engine, if_exists=if_exists, index=False, dtype=dtype)
+
+    # LOAD DATA reads backslash as its escape character (that is how \N means NULL),
+    # so literal backslashes in text columns are doubled before writing the file
+    payload = df.copy(deep=False)
+    for col in payload.columns:
+        if not pd.api.types.is_numeric_dtype(payload[col]):
+            payload[col] = payload[col].astype("string").str.replace("\\", "\\\\", regex=False)
+
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as tmp:
+        payload.to_csv(tmp, index=False, header=False, na_rep="\\N", lineterminator="\n")
+        tmp_path = tmp.name
+    # MySQL expects forward slashes in the file path, also on Windows
+    infile_path = tmp_path.replace("\\", "/")
+    try:
+        raw_connection = engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{infile_path}' INTO TABLE `{table}` "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                "LINES TERMINATED BY '\\n'"
+            )
+            cursor.close()
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+    finally:
+        os.remove(tmp_path)
+
+def _to_float_array(values) -> pa.ChunkedArray:
+    """
+    Casts Arrow text values to float64 with vectorized compute kernels.
+    Values that do not match NUMBER_PATTERN become null instead of raising.
+    """
+    if not (pa.types.is_string(values.type) or pa.types.is_large_string(values.type)):
+        values = pc.cast(values, pa.string())
+    values = pc.utf8_lower(pc.utf8_trim_whitespace(values))
+    values = pc.replace_substring_regex(values, r"^\+", "", max_replacements=1)
+    is_number = pc.match_substring_regex(values, NUMBER_PATTERN)
+    return pc.cast(pc.if_else(is_number, values, pa.scalar(None, values.type)), pa.float64())
+
+def _sample(values):
+    """Returns up to NUMERIC_SAMPLE_ROWS values taken at even strides across the whole array."""
+    step = max(1, len(values) // NUMERIC_SAMPLE_ROWS)
+    return values.take(pa.array(np.arange(0, len(values), step)[:NUMERIC_SAMPLE_ROWS]))
+
+def _numeric_ratio(values) -> float:
+    """Returns the share of non-null values in an Arrow array."""
+    return 1 - values.null_count / len(values) if len(values) else 0.0
+
+def _downcast(values, col: str):
+    """Casts a known numeric column to its compact type when no value overflows or loses precision."""
+    target = DOWNCAST_TYPES.get(col)
+    if target is None:
+        return values
+    try:
+        return pc.cast(values, target)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return values
+
+def _convert_numeric(col: str, series: pd.Series, force: bool = False):
+    """
+    Converts one column with Arrow compute kernels if it is mostly numeric.
+    Args:
+        col (str): Sanitized column name.
+        series (pd.Series): Column values.
+        force (bool): Convert without detection (the column was already found numeric).
+    Returns:
+        Null-filled (and downcast) Arrow array, or None if the column is not numeric.
+    """
+    # Arrow-backed columns convert without copying; the type check is O(1)
+    values = pa.array(series)
+    is_typed_numeric = pa.types.is_integer(values.type) or pa.types.is_floating(values.type)
+    if col in KNOWN_NUMERIC_COLUMNS and not is_typed_numeric:
+        # Known numeric column stored as text: strip the formatting and convert
+        # directly, without the generic detection below
+        cleaned = pc.replace_substring_regex(pc.cast(values, pa.string()), NUMBER_FORMATTING_CHARS, "")
+        values = _to_float_array(cleaned)
+        return _downcast(pc.fill_null(values, 0.0), col)
+    if not is_typed_numeric:
+        # Screen a strided sample of the raw values first so text columns skip the full cast
+        if not force and _numeric_ratio(_to_float_array(_sample(values))) < NUMERIC_SAMPLE_CUTOFF:
+            return None
+        # Try converting column to numeric; unparseable values become null
+        values = _to_float_array(values)
+    numeric_ratio = _numeric_ratio(values)  # % of numeric values
+    if force or numeric_ratio > 0.8:  # If >80% values can be numeric
+        return _downcast(pc.fill_null(values, pa.scalar(0).cast(values.type)), col)
+    return None
+
+def _has_clean_dtypes(df: pd.DataFrame) -> bool:
+    """Returns True if every column is Arrow-numeric or a known text column."""
+    return all(
+        col in KNOWN_STRING_COLUMNS
+        or (
+            isinstance(dtype, pd.ArrowDtype)
+            and (pa.types.is_integer(dtype.pyarrow_dtype) or pa.types.is_floating(dtype.pyarrow_dtype))
+        )
+        for col, dtype in df.dtypes.items()
+    )
+
+def _open_snapshot(path: str, schema: pa.Schema):
+    """Opens a Parquet snapshot writer, or returns None if the location is not writable."""
+    try:
+        return pq.ParquetWriter(path, schema, compression="snappy")
+    except OSError as e:
+        get_run_logger().warning("Skipping Parquet snapshot '%s': %s", path, e)
+        return None
+
+def _write_snapshot_batch(writer, batch: pa.RecordBatch):
+    """Appends a batch to the snapshot; on failure closes the writer and returns None."""
+    try:
+        writer.write_batch(batch)
+        return writer
+    except OSError as e:
+        get_run_logger().warning("Abandoning Parquet snapshot: %s", e)
+        with contextlib.suppress(OSError):
+            writer.close()
+        return None
+
+def _publish_snapshot(writer, partial_path: str, cache_path: str):
+    """Closes the snapshot and moves it into place; failures only cost the cache."""
+    try:
+        writer.close()
+        os.replace(partial_path, cache_path)
+    except OSError as e:
+        get_run_logger().warning("Could not publish Parquet snapshot '%s': %s", cache_path, e)
+
+def _batch_to_frame(batch: pa.RecordBatch) -> pd.DataFrame:
+    """Converts an Arrow record batch into an Arrow-backed DataFrame chunk."""
+    df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+    logger = get_run_logger()
+    logger.info("Data extracted successfully.")
+    logger.info("Number of rows extracted: %d", len(df))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Columns: %s", df.columns.tolist())
+    return df
+
 # -----------------------------------------------
 # Prefect Tasks
 # -----------------------------------------------
 @task
-def extract_data(file_path: str) -> pd.DataFrame:
+def extract_data(file_path: str) -> Iterator[pd.DataFrame]:
     """
     Extract task:
     ---------------
-    Reads BMW sales data from a CSV file.
+    Reads BMW sales data from a CSV file in chunks.
+    - Reuses the Parquet snapshot next to the CSV when it is up to date.
+    - Otherwise parses the CSV and refreshes the snapshot while streaming.
     Args:
         file_path (str): Path to the CSV file.
-        Returns:
-        pd.DataFrame: Extracted data as a pandas DataFrame.  
+        Yields:
+        pd.DataFrame: Chunks of up to EXTRACT_CHUNK_ROWS rows.
     """
-    df = pd.read_csv(file_path)
-    print("Data extracted successfully.")
-    print(f"Number of rows extracted: {len(df)}")
-    print(f"Columns: {df.columns.tolist()}")
-    return df
+    logger = get_run_logger()
+    cache_path = f"{file_path}.parquet"
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+        logger.info("Reading cached snapshot '%s'.", cache_path)
+        for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=EXTRACT_CHUNK_ROWS):
+            yield _batch_to_frame(batch)
+        return
+
+    # DuckDB parses the file in parallel and infers column types from every
+    # row (sample_size = -1), so fully numeric columns arrive already typed
+    escaped_path = file_path.replace("'", "''")
+    partial_cache_path = f"{cache_path}.partial"
+    with duckdb.connect() as con:
+        reader = con.execute(
+            f"SELECT * FROM read_csv_auto('{escaped_path}', sample_size = -1)"
+        ).fetch_record_batch(EXTRACT_CHUNK_ROWS)
+        # the snapshot is only an optimization: if it cannot be written
+        # (e.g. read-only data directory) the chunks are streamed without it
+        writer = _open_snapshot(partial_cache_path, reader.schema)
+        try:
+            for batch in reader:
+                if writer is not None:
+                    writer = _write_snapshot_batch(writer, batch)
+                yield _batch_to_frame(batch)
+            # only publish the snapshot once the whole file has been written
+            if writer is not None:
+                _publish_snapshot(writer, partial_cache_path, cache_path)
+                writer = None
+        finally:
+            if writer is not None:
+                with contextlib.suppress(OSError):
+                    writer.close()
+            with contextlib.suppress(OSError):
+                if os.path.exists(partial_cache_path):
+                    os.remove(partial_cache_path)
 
 @task
-def transform_data(df: pd.DataFrame) -> pd.DataFrame:
+def transform_data(df: pd.DataFrame, numeric_columns: list = None) -> pd.DataFrame:
     """
     Transform Task:
     ---------------
@@ -91,36 +411,47 @@ def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     - Handles invalid or missing values.
     Args:
         df (pd.DataFrame): Raw data DataFrame.
+        numeric_columns (list): Columns to convert, as detected on the first chunk.
+            When None they are detected here and recorded in df.attrs["numeric_columns"].
         Returns:
         pd.DataFrame: Cleaned and transformed DataFrame.
     """
+    logger = get_run_logger()
     # clean column names
-    df.columns = (
-        df.columns.str.strip()
-        .str.lower()
-        .str.replace(" ", "_")
-        .str.replace("[^a-z0-9_]", "", regex=True)
-    )
-    # Dynamically detecting numeric columns
+    df.columns = [
+        INVALID_COLUMN_CHARS.sub("", col.strip().lower().replace(" ", "_"))
+        for col in df.columns
+    ]
+    # Dynamically detecting and converting numeric columns in a single pass.
+    # Columns are independent and the Arrow kernels release the GIL, so they
+    # are processed on a thread pool.
+    force = numeric_columns is not None
+    columns = [col for col in numeric_columns if col in df.columns] if force else list(df.columns)
+    if not force and _has_clean_dtypes(df):
+        # Already typed (e.g. read from the Parquet snapshot): skip scanning the
+        # text columns, the numeric ones only need null-filling and downcasting
+        logger.info("Input dtypes are clean; skipping numeric detection on text columns.")
+        columns = [col for col in columns if col not in KNOWN_STRING_COLUMNS]
+    with ThreadPoolExecutor() as executor:
+        converted = list(executor.map(
+            _convert_numeric, columns, [df[col] for col in columns], [force] * len(columns)
+        ))
     numeric_columns=[]
-    for col in df.columns:
-        try:
-            # Try converting column to numeric temporarily
-            numeric_series = pd.to_numeric(df[col], errors="coerce")
-            numeric_ratio = numeric_series.notna().mean()  # % of numeric values
-            if numeric_ratio > 0.8:  # If >80% values can be numeric
-                numeric_columns.append(col)
-        except Exception:
-            continue
-    print(f"Detected numeric columns: {numeric_columns}")
-    # Convert detected numeric columns
-    for col in numeric_columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
-    print("Data transformed successfully.")
+    for col, values in zip(columns, converted):
+        if values is not None:
+            df[col] = pd.Series(pd.arrays.ArrowExtensionArray(values), index=df.index)
+            numeric_columns.append(col)
+    logger.info("Detected numeric columns: %s", numeric_columns)
+    df.attrs["numeric_columns"] = numeric_columns
+    # Dictionary-encode low-cardinality text columns to shrink the frame in memory
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and col not in numeric_columns:
+            df[col] = df[col].astype("category")
+    logger.info("Data transformed successfully.")
     return df
 
 @task
-def load_data(df: pd.DataFrame):
+def load_data(df: pd.DataFrame, if_exists: str = "replace"):
     """
     Load Task:
     ---------------
@@ -130,45 +461,86 @@ def load_data(df: pd.DataFrame):
     - Handles table creation if it does not exist.
     Args:
         df (pd.DataFrame): Cleaned data DataFrame.
+        if_exists (str): "replace" for the first chunk, "append" for the rest.
 
     """
-    # establishing database connection
-    encoded_password = quote_plus(DB_PASSWORD)
-    connection_route = f"mysql+mysqlconnector://{DB_USER}:{encoded_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-    engine = create_engine(connection_route)
-    print("Database connection established.")
+    logger = get_run_logger()
+    # establishing database connection (pooled engine shared across loads)
+    engine = get_engine()
+    logger.info("Database connection established.")
+
+    # Declare the table schema instead of letting to_sql infer it
+    sql_types = {col: SCHEMA[col] for col in df.columns if col in SCHEMA}
 
     # Load data into the database
     try:
-        df.to_sql(name=DB_TABLE, con=engine, if_exists="replace", index=False)
-        print(f"Data loaded successfully into table '{DB_TABLE}'.")
+        if USE_LOAD_INFILE:
+            load_data_infile(df, engine, DB_TABLE, if_exists=if_exists, dtype=sql_types)
+        else:
+            # Portable path: multi-row INSERT batches
+            chunksize = min(MAX_INSERT_CHUNKSIZE, MAX_INSERT_PLACEHOLDERS // max(len(df.columns), 1))
+            df.to_sql(
+                name=DB_TABLE,
+                con=engine,
+                if_exists=if_exists,
+                index=False,
+                method="multi",
+                chunksize=chunksize,
+                dtype=sql_types,
+            )
+        logger.info("Data loaded successfully into table '%s'.", DB_TABLE)
     except Exception as e:
-        print(f"Error loading data into database: {e}")
-    finally:
-        engine.dispose()
-        print("Database connection closed.")
+        logger.error("Error loading data into database: %s", e)
+        # fail the task so later chunks are not appended to a partial table
+        raise
 # -----------------------------------------------
 # Prefect Flow
 # -----------------------------------------------
-@flow
+def _wait_for_chunk(transform_future, load_future):
+    """Waits for one chunk's tasks, raising the first failure (transform before load)."""
+    transform_future.result()
+    load_future.result()
+
+@flow(task_runner=ThreadPoolTaskRunner(max_workers=2 * MAX_CHUNKS_IN_FLIGHT))
 def sales_etl_flow():
     """
     ETL Flow:
     ---------------
-    Orchestrates the ETL process:
+    Orchestrates the ETL process chunk by chunk:
     - Extracts data from CSV.
     - Transforms the data.
     - Loads the data into MySQL database.
+    Chunk k is loaded while chunk k+1 is extracted and transformed.
     """
+    logger = get_run_logger()
+    pending_chunks = deque()
+    previous_load = None
+    numeric_columns = None
     # Extract
-    raw_data = extract_data(CSV_FILE_PATH)
-    
-    # Transform
-    cleaned_data = transform_data(raw_data)
-    
-    # Load
-    load_data(cleaned_data)
-    print("ETL flow completed successfully.")
+    for chunk_number, raw_data in enumerate(extract_data(CSV_FILE_PATH)):
+        # Transform
+        cleaned_data = transform_data.submit(raw_data, numeric_columns=numeric_columns)
+        if numeric_columns is None:
+            # The first chunk decides which columns are numeric; every later chunk
+            # converts the same columns so appends match the table created from it
+            numeric_columns = cleaned_data.result().attrs["numeric_columns"]
+
+        # Load: the first chunk recreates the table, the rest are appended,
+        # so each load waits for the one before it
+        previous_load = load_data.submit(
+            cleaned_data,
+            if_exists="replace" if chunk_number == 0 else "append",
+            wait_for=[previous_load] if previous_load else None,
+        )
+        pending_chunks.append((cleaned_data, previous_load))
+
+        # Bound memory: wait for the oldest chunk before extracting more.
+        # result() re-raises task failures so they fail the flow.
+        if len(pending_chunks) >= MAX_CHUNKS_IN_FLIGHT:
+            _wait_for_chunk(*pending_chunks.popleft())
+    for pending_chunk in pending_chunks:
+        _wait_for_chunk(*pending_chunk)
+    logger.info("ETL flow completed successfully.")
 
 # -----------------------------------------------
 # Main Execution (Entry Point)